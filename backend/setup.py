@@ -8,6 +8,8 @@ setup(
     install_requires=[
         "fastapi>=0.104.1",
         "uvicorn[standard]>=0.24.0",
+        "uvloop>=0.19.0; sys_platform != 'win32'",
+        "httptools>=0.6.1",
         "pydantic>=2.5.0",
         "pydantic-settings>=2.1.0",
         "python-dotenv>=1.0.0",
@@ -19,6 +21,7 @@ setup(
         "openai>=1.3.7",
         "httpx>=0.25.2",
         "websockets>=12.0",
+        "orjson>=3.9.10",
     ],
     python_requires=">=3.10",
 )
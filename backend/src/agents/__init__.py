@@ -1,6 +1,7 @@
 from .base import BaseAgent
-from .openai_agent import OpenAIAgent
-from .anthropic_agent import AnthropicAgent
+from .cache import LLMCache, CacheBackend, InMemoryBackend, RedisBackend, SemanticIndex
+from .openai_agent import OpenAIAgent, close_clients as close_openai_clients
+from .anthropic_agent import AnthropicAgent, close_clients as close_anthropic_clients
 from ..models import AgentConfig
 
 
@@ -18,10 +19,22 @@ def get_agent(config: AgentConfig) -> BaseAgent:
     return agent_class(config)
 
 
+async def close_clients() -> None:
+    """Close the pooled provider clients shared by agents."""
+    await close_openai_clients()
+    await close_anthropic_clients()
+
+
 __all__ = [
     "BaseAgent",
+    "LLMCache",
+    "CacheBackend",
+    "InMemoryBackend",
+    "RedisBackend",
+    "SemanticIndex",
     "OpenAIAgent",
     "AnthropicAgent",
     "get_agent",
+    "close_clients",
 ]
 
@@ -1,9 +1,99 @@
-import json
+import logging
+import orjson
+from contextlib import aclosing
 from typing import Optional, AsyncIterator
 from anthropic import AsyncAnthropic
 
 from .base import BaseAgent
-from ..models import TradeRequest, Platform, TradeType
+from .transport import create_http_client
+from ..models import TradeRequest
+
+logger = logging.getLogger(__name__)
+
+
+PROMPT_CACHING_BETA = "prompt-caching-2024-07-31"
+
+# Clients are shared per API key so agents reuse one connection pool
+_CLIENTS: dict[str, AsyncAnthropic] = {}
+
+
+def _get_client(api_key: str) -> AsyncAnthropic:
+    """Get or create the pooled client for an API key."""
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        client = AsyncAnthropic(
+            api_key=api_key,
+            http_client=create_http_client(),
+            default_headers={"anthropic-beta": PROMPT_CACHING_BETA}
+        )
+        _CLIENTS[api_key] = client
+    return client
+
+
+async def close_clients() -> None:
+    """Close all pooled Anthropic clients."""
+    for client in _CLIENTS.values():
+        await client.close()
+    _CLIENTS.clear()
+
+
+TRADE_SCHEMA_PROMPT = """
+
+If you decide to execute a trade, respond with a JSON object in this format:
+{
+  "action": "trade",
+  "platform": "solana|polymarket|kalshi",
+  "trade_type": "buy|sell|swap",
+  "symbol": "symbol/market identifier",
+  "amount": 0.0,
+  "price": 0.0 (optional),
+  "slippage": 0.01,
+  "reasoning": "your reasoning"
+}
+
+If you decide not to trade, respond with:
+{
+  "action": "hold",
+  "reasoning": "your reasoning"
+}
+"""
+
+
+def _cached_system(text: str) -> list[dict]:
+    """Wrap a system prompt as a block the provider may cache as a prefix."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+def _extract_first_json(text: str) -> Optional[str]:
+    """Return the first balanced top-level JSON object in text, if any."""
+    start = text.find("{")
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_string = False
+    escaped = False
+    
+    for i in range(start, len(text)):
+        char = text[i]
+        
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    
+    return None
 
 
 class AnthropicAgent(BaseAgent):
@@ -15,8 +105,11 @@ class AnthropicAgent(BaseAgent):
         if not api_key:
             raise ValueError("Anthropic API key is required")
         
-        self.client = AsyncAnthropic(api_key=api_key)
+        self.client = _get_client(api_key)
         self.model = self.config.model
+        self._trade_system_prompt = self._system_prompt + TRADE_SCHEMA_PROMPT
+        self._system_blocks = _cached_system(self._system_prompt)
+        self._trade_system_blocks = _cached_system(self._trade_system_prompt)
     
     async def analyze_market(
         self,
@@ -25,28 +118,39 @@ class AnthropicAgent(BaseAgent):
     ) -> dict:
         """Analyze market using Anthropic Claude."""
         try:
-            system_prompt = self._build_system_prompt()
+            system_prompt = self._system_prompt
             market_context = self._build_trade_context(market_data)
             
             user_message = f"{market_context}\n\n{context}\n\nProvide market analysis and insights."
             
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=2048,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=0.7
-            )
+            temperature = 0.7
             
-            analysis = response.content[0].text if response.content else ""
+            async def create_analysis() -> dict:
+                response = await self.client.messages.create(
+                    model=self.model,
+                    max_tokens=2048,
+                    system=self._system_blocks,
+                    messages=[
+                        {"role": "user", "content": user_message}
+                    ],
+                    temperature=temperature
+                )
+                
+                analysis = response.content[0].text if response.content else ""
+                
+                return {
+                    "analysis": analysis,
+                    "model": self.model,
+                    "tokens_used": response.usage.input_tokens + response.usage.output_tokens
+                }
             
-            return {
-                "analysis": analysis,
-                "model": self.model,
-                "tokens_used": response.usage.input_tokens + response.usage.output_tokens
-            }
+            return await self.cache.get_or_set(
+                self.model,
+                system_prompt,
+                user_message,
+                temperature,
+                create_analysis
+            )
             
         except Exception as e:
             return {"error": str(e)}
@@ -58,71 +162,58 @@ class AnthropicAgent(BaseAgent):
         context: str = ""
     ) -> Optional[TradeRequest]:
         """Generate trade decision using Anthropic Claude."""
+        key = self._decision_key(market_data, portfolio, context)
+        if key == self._last_decision_key:
+            return self._last_decision
+        
         try:
-            system_prompt = self._build_system_prompt()
-            system_prompt += """
-
-If you decide to execute a trade, respond with a JSON object in this format:
-{
-  "action": "trade",
-  "platform": "solana|polymarket|kalshi",
-  "trade_type": "buy|sell|swap",
-  "symbol": "symbol/market identifier",
-  "amount": 0.0,
-  "price": 0.0 (optional),
-  "slippage": 0.01,
-  "reasoning": "your reasoning"
-}
-
-If you decide not to trade, respond with:
-{
-  "action": "hold",
-  "reasoning": "your reasoning"
-}
-"""
+            system_prompt = self._trade_system_prompt
             
             market_context = self._build_trade_context(market_data, portfolio)
             user_message = f"{market_context}\n\n{context}\n\nShould we execute a trade?"
             
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                system=system_prompt,
-                messages=[
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=0.3
-            )
+            temperature = 0.3
             
-            content = response.content[0].text if response.content else ""
+            async def create_decision() -> str:
+                response = await self.client.messages.create(
+                    model=self.model,
+                    max_tokens=1024,
+                    system=self._trade_system_blocks,
+                    messages=[
+                        {"role": "user", "content": user_message}
+                    ],
+                    temperature=temperature
+                )
+                
+                return response.content[0].text if response.content else ""
+            
+            content = await self.cache.get_or_set(
+                self.model,
+                system_prompt,
+                user_message,
+                temperature,
+                create_decision
+            )
             
             # Extract JSON from response
             try:
-                # Find JSON in response
-                start = content.find('{')
-                end = content.rfind('}') + 1
+                json_str = _extract_first_json(content)
                 
-                if start >= 0 and end > start:
-                    json_str = content[start:end]
-                    decision = json.loads(json_str)
+                if json_str:
+                    decision = orjson.loads(json_str)
                     
                     if decision.get("action") == "trade":
-                        return TradeRequest(
-                            platform=Platform(decision["platform"]),
-                            trade_type=TradeType(decision["trade_type"]),
-                            symbol=decision["symbol"],
-                            amount=decision["amount"],
-                            price=decision.get("price"),
-                            slippage=decision.get("slippage", 0.01),
-                            metadata={"reasoning": decision.get("reasoning", "")}
+                        return self._remember_decision(
+                            key,
+                            self._build_trade_request(decision)
                         )
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
             
-            return None
+            return self._remember_decision(key, None)
             
-        except Exception as e:
-            print(f"Error generating trade decision: {e}")
+        except Exception:
+            logger.exception("Error generating trade decision")
             return None
     
     async def stream_analysis(
@@ -132,7 +223,6 @@ If you decide not to trade, respond with:
     ) -> AsyncIterator[str]:
         """Stream analysis in real-time."""
         try:
-            system_prompt = self._build_system_prompt()
             market_context = self._build_trade_context(market_data)
             
             user_message = f"{market_context}\n\n{context}\n\nProvide detailed market analysis."
@@ -140,14 +230,15 @@ If you decide not to trade, respond with:
             async with self.client.messages.stream(
                 model=self.model,
                 max_tokens=2048,
-                system=system_prompt,
+                system=self._system_blocks,
                 messages=[
                     {"role": "user", "content": user_message}
                 ],
                 temperature=0.7
             ) as stream:
-                async for text in stream.text_stream:
-                    yield text
+                async with aclosing(self._stream_text(stream.text_stream)) as texts:
+                    async for text in texts:
+                        yield text
                     
         except Exception as e:
             yield f"Error: {str(e)}"
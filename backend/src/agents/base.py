@@ -1,15 +1,55 @@
+import asyncio
+import hashlib
+import io
+import time
 from abc import ABC, abstractmethod
 from typing import Optional, AsyncIterator
-from ..models import AgentConfig, TradeRequest
+import orjson
+from ..models import AgentConfig, TradeRequest, Platform, TradeType
+from .cache import LLMCache
+
+
+# Streamed text is flushed once this many characters or seconds accumulate
+STREAM_FLUSH_CHARS = 256
+STREAM_FLUSH_SECONDS = 0.05
+
+# Max coalesced chunks held between the provider stream and the client
+STREAM_QUEUE_SIZE = 64
+
+TRADING_GUIDELINES = """
+
+Trading Guidelines:
+- Always consider risk management and position sizing
+- Analyze market conditions before making decisions
+- Consider slippage and fees in trade calculations
+- Never exceed maximum position size or risk limits
+- Provide clear reasoning for each trade decision
+
+Available Platforms: """
 
 
 class BaseAgent(ABC):
     """Base class for AI trading agents."""
     
-    def __init__(self, config: AgentConfig):
+    def __init__(self, config: AgentConfig, cache: Optional[LLMCache] = None):
         self.config = config
+        self.cache = cache or LLMCache(max_temperature=config.cache_max_temperature)
+        # Config is fixed for the agent's lifetime, so build the prompt once
+        self._system_prompt = self._build_system_prompt()
+        self._risk_context = (
+            f"\nMax Position Size: {config.max_position_size}\n"
+            f"Risk Limit: {config.risk_limit * 100}%"
+        )
+        # Last trade decision, reused while the polled inputs are unchanged
+        self._last_decision_key: Optional[str] = None
+        self._last_decision: Optional[TradeRequest] = None
         self._initialize()
     
+    @property
+    def stats(self) -> dict[str, int]:
+        """Response cache hit/miss counters."""
+        return self.cache.stats
+    
     @abstractmethod
     def _initialize(self) -> None:
         """Initialize agent-specific resources."""
@@ -43,22 +83,144 @@ class BaseAgent(ABC):
         """Stream analysis in real-time."""
         pass
     
+    async def close(self) -> None:
+        """Release agent resources."""
+        pass
+    
+    async def _buffer_stream(
+        self,
+        chunks: AsyncIterator[Optional[str]]
+    ) -> AsyncIterator[str]:
+        """Coalesce small streamed text chunks into larger ones."""
+        buffer: list[str] = []
+        size = 0
+        last_flush = time.monotonic()
+        
+        try:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                
+                buffer.append(chunk)
+                size += len(chunk)
+                
+                now = time.monotonic()
+                if size >= STREAM_FLUSH_CHARS or now - last_flush >= STREAM_FLUSH_SECONDS:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    size = 0
+                    last_flush = now
+        except Exception:
+            # Hand over what was received before the failure
+            if buffer:
+                yield "".join(buffer)
+            raise
+        
+        if buffer:
+            yield "".join(buffer)
+    
+    async def _decouple_stream(
+        self,
+        chunks: AsyncIterator[str],
+        maxsize: int = STREAM_QUEUE_SIZE
+    ) -> AsyncIterator[str]:
+        """Drain a stream in a producer task through a bounded queue.
+        
+        The provider stream keeps reading while the consumer is slow, up to
+        `maxsize` chunks. Closing this generator cancels the producer so the
+        upstream connection is released right away.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize)
+        done = object()
+        
+        async def pump() -> None:
+            try:
+                async for chunk in chunks:
+                    await queue.put(chunk)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(done)
+        
+        producer = asyncio.create_task(pump())
+        
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+    
+    def _stream_text(self, chunks: AsyncIterator[Optional[str]]) -> AsyncIterator[str]:
+        """Coalesce provider text chunks and relay them through a bounded queue."""
+        return self._decouple_stream(self._buffer_stream(chunks))
+    
+    @staticmethod
+    def _decision_key(market_data: dict, portfolio: dict, context: str) -> str:
+        """Hash the inputs of a trade decision."""
+        payload = orjson.dumps(
+            {"m": market_data, "p": portfolio, "c": context},
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+    
+    def _remember_decision(
+        self,
+        key: str,
+        decision: Optional[TradeRequest]
+    ) -> Optional[TradeRequest]:
+        """Record a decision as the answer for its inputs and return it."""
+        self._last_decision_key = key
+        self._last_decision = decision
+        return decision
+    
+    def _build_trade_request(self, decision: dict) -> TradeRequest:
+        """Build a trade request from a parsed LLM decision.
+        
+        Well-formed decisions skip pydantic validation via model_construct;
+        anything else goes through the validating constructor so bad fields
+        raise a ValidationError.
+        """
+        try:
+            symbol = decision["symbol"]
+            if not isinstance(symbol, str):
+                raise TypeError("symbol must be a string")
+            
+            price = decision.get("price")
+            slippage = float(decision.get("slippage", 0.01))
+            if not 0 <= slippage <= 1:
+                raise ValueError("slippage must be between 0 and 1")
+            
+            return TradeRequest.model_construct(
+                platform=Platform(decision["platform"]),
+                trade_type=TradeType(decision["trade_type"]),
+                symbol=symbol,
+                amount=float(decision["amount"]),
+                price=float(price) if price is not None else None,
+                slippage=slippage,
+                metadata={"reasoning": decision.get("reasoning", "")}
+            )
+        except (KeyError, TypeError, ValueError):
+            return TradeRequest(
+                platform=decision.get("platform"),
+                trade_type=decision.get("trade_type"),
+                symbol=decision.get("symbol"),
+                amount=decision.get("amount"),
+                price=decision.get("price"),
+                slippage=decision.get("slippage", 0.01),
+                metadata={"reasoning": decision.get("reasoning", "")}
+            )
+    
     def _build_system_prompt(self) -> str:
         """Build the system prompt with trading guidelines."""
-        base_prompt = self.config.system_prompt
-        
-        guidelines = """
-
-Trading Guidelines:
-- Always consider risk management and position sizing
-- Analyze market conditions before making decisions
-- Consider slippage and fees in trade calculations
-- Never exceed maximum position size or risk limits
-- Provide clear reasoning for each trade decision
-
-Available Platforms: """ + ", ".join(p.value for p in self.config.platforms)
+        platforms = ", ".join(p.value for p in self.config.platforms)
         
-        return base_prompt + guidelines
+        return self.config.system_prompt + TRADING_GUIDELINES + platforms
     
     def _build_trade_context(
         self,
@@ -66,18 +228,27 @@ Available Platforms: """ + ", ".join(p.value for p in self.config.platforms)
         portfolio: Optional[dict] = None
     ) -> str:
         """Build context string for the agent."""
-        context_parts = ["Market Data:"]
+        buffer = io.StringIO()
+        write = buffer.write
         
+        write("Market Data:\n")
         for key, value in market_data.items():
-            context_parts.append(f"- {key}: {value}")
+            write("- ")
+            write(str(key))
+            write(": ")
+            write(str(value))
+            write("\n")
         
         if portfolio:
-            context_parts.append("\nPortfolio:")
+            write("\nPortfolio:\n")
             for key, value in portfolio.items():
-                context_parts.append(f"- {key}: {value}")
+                write("- ")
+                write(str(key))
+                write(": ")
+                write(str(value))
+                write("\n")
         
-        context_parts.append(f"\nMax Position Size: {self.config.max_position_size}")
-        context_parts.append(f"Risk Limit: {self.config.risk_limit * 100}%")
+        write(self._risk_context)
         
-        return "\n".join(context_parts)
+        return buffer.getvalue()
 
@@ -0,0 +1,85 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+
+class Batcher:
+    """Coalesce concurrent requests into windowed batches.
+
+    Items submitted through `run` are collected until either `max_batch`
+    items are waiting or `max_wait_ms` has passed since the first one, and
+    are then handed to `executor` together. The executor returns one result
+    per item, in order; an exception instance in place of a result is
+    raised to that item's caller only.
+    """
+
+    def __init__(
+        self,
+        executor: Callable[[list[Any]], Awaitable[Sequence[Any]]],
+        max_batch: int = 32,
+        max_wait_ms: float = 10
+    ):
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        self._dispatches: set[asyncio.Task] = set()
+
+    async def run(self, item: Any) -> Any:
+        """Submit an item and wait for its result."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_loop())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def _flush_loop(self) -> None:
+        """Collect windows of queued items and dispatch them."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Dispatch without blocking so the next window can fill meanwhile
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        """Run the executor on a batch and resolve each caller's future."""
+        try:
+            results = await self.executor([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop the flush loop and wait for in-flight batches."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
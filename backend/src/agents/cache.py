@@ -0,0 +1,206 @@
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Protocol, Sequence
+
+import orjson
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached LLM responses."""
+
+    async def get(self, key: str) -> Optional[dict]:
+        """Return the stored entry for key, or None on a miss."""
+        ...
+
+    async def set(self, key: str, entry: dict) -> None:
+        """Store an entry under key."""
+        ...
+
+
+class InMemoryBackend:
+    """Process-local LRU cache backend."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[dict]:
+        """Get an entry and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: dict) -> None:
+        """Store an entry, evicting the least recently used one if full."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class RedisBackend:
+    """Redis cache backend shared across workers (requires `redis`)."""
+
+    def __init__(
+        self,
+        url: str,
+        ttl: Optional[int] = None,
+        prefix: str = "syrup:llm:"
+    ):
+        from redis.asyncio import Redis
+
+        self.client = Redis.from_url(url)
+        self.ttl = ttl
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[dict]:
+        """Get an entry from Redis."""
+        raw = await self.client.get(self.prefix + key)
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, entry: dict) -> None:
+        """Store an entry in Redis."""
+        await self.client.set(self.prefix + key, orjson.dumps(entry), ex=self.ttl)
+
+
+class SemanticIndex:
+    """Embedding-similarity lookup for paraphrased prompts (requires `numpy`)."""
+
+    def __init__(
+        self,
+        embed: Callable[[str], Awaitable[Sequence[float]]],
+        threshold: float = 0.92,
+        max_size: int = 1024
+    ):
+        self.embed = embed
+        self.threshold = threshold
+        self.max_size = max_size
+        self._scopes: dict[str, tuple[Any, list[Any]]] = {}
+
+    async def _embed(self, text: str):
+        """Embed text as a unit-length vector so dot product is cosine."""
+        import numpy as np
+
+        vector = np.asarray(await self.embed(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    async def lookup(self, scope: str, text: str) -> Optional[Any]:
+        """Return the closest cached value in scope above the threshold."""
+        if scope not in self._scopes:
+            return None
+
+        vectors, values = self._scopes[scope]
+        scores = vectors @ await self._embed(text)
+        best = int(scores.argmax())
+
+        if scores[best] > self.threshold:
+            return values[best]
+        return None
+
+    async def add(self, scope: str, text: str, value: Any) -> None:
+        """Index a value under the embedding of text."""
+        import numpy as np
+
+        query = await self._embed(text)
+
+        if scope in self._scopes:
+            vectors, values = self._scopes[scope]
+            vectors = np.vstack([vectors, query])[-self.max_size:]
+            values = (values + [value])[-self.max_size:]
+        else:
+            vectors, values = query[np.newaxis, :], [value]
+
+        self._scopes[scope] = (vectors, values)
+
+
+class LLMCache:
+    """Two-tier (exact + semantic) cache for LLM completions."""
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        max_temperature: float = 0.0,
+        semantic: Optional[SemanticIndex] = None
+    ):
+        self.backend = backend or InMemoryBackend()
+        self.max_temperature = max_temperature
+        self.semantic = semantic
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        model: str,
+        system_prompt: str,
+        user_message: str,
+        temperature: float
+    ) -> str:
+        """Build the exact-match key for a completion request."""
+        payload = json.dumps(
+            {
+                "model": model,
+                "system": system_prompt,
+                "user": user_message,
+                "temperature": temperature
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def _make_scope(model: str, system_prompt: str, temperature: float) -> str:
+        """Build the key that semantic matches must agree on."""
+        return LLMCache.make_key(model, system_prompt, "", temperature)
+
+    async def get_or_set(
+        self,
+        model: str,
+        system_prompt: str,
+        user_message: str,
+        temperature: float,
+        factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a cached completion, or call factory and cache its result.
+
+        Values must be JSON-serializable so they can live in any backend.
+        Requests above `max_temperature` are not cached.
+        """
+        if temperature > self.max_temperature:
+            return await factory()
+
+        key = self.make_key(model, system_prompt, user_message, temperature)
+
+        entry = await self.backend.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry["value"]
+
+        if self.semantic:
+            scope = self._make_scope(model, system_prompt, temperature)
+            value = await self.semantic.lookup(scope, user_message)
+            if value is not None:
+                self.semantic_hits += 1
+                return value
+
+        self.misses += 1
+        value = await factory()
+        await self.backend.set(key, {"value": value})
+
+        if self.semantic and value is not None:
+            await self.semantic.add(scope, user_message, value)
+
+        return value
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters."""
+        return {
+            "hits": self.hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+        }
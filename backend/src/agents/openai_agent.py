@@ -1,9 +1,36 @@
-import json
+import asyncio
+import logging
+import orjson
+from contextlib import aclosing
 from typing import Optional, AsyncIterator
 from openai import AsyncOpenAI
 
 from .base import BaseAgent
-from ..models import TradeRequest, Platform, TradeType
+from .transport import create_http_client
+from .batcher import Batcher
+from ..models import TradeRequest
+
+logger = logging.getLogger(__name__)
+
+
+# Clients are shared per API key so agents reuse one connection pool
+_CLIENTS: dict[str, AsyncOpenAI] = {}
+
+
+def _get_client(api_key: str) -> AsyncOpenAI:
+    """Get or create the pooled client for an API key."""
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(api_key=api_key, http_client=create_http_client())
+        _CLIENTS[api_key] = client
+    return client
+
+
+async def close_clients() -> None:
+    """Close all pooled OpenAI clients."""
+    for client in _CLIENTS.values():
+        await client.close()
+    _CLIENTS.clear()
 
 
 class OpenAIAgent(BaseAgent):
@@ -15,8 +42,72 @@ class OpenAIAgent(BaseAgent):
         if not api_key:
             raise ValueError("OpenAI API key is required")
         
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = _get_client(api_key)
         self.model = self.config.model
+        self._batcher = Batcher(self._batch_executor)
+        # Route this agent's requests to the same provider prompt-prefix cache
+        self._prompt_cache_body = {"prompt_cache_key": self.config.name}
+        
+        # Trade function schema depends only on the configured platforms
+        self._trade_function = {
+            "name": "execute_trade",
+            "description": "Execute a trade on a supported platform",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "platform": {
+                        "type": "string",
+                        "enum": [p.value for p in self.config.platforms],
+                        "description": "Trading platform"
+                    },
+                    "trade_type": {
+                        "type": "string",
+                        "enum": ["buy", "sell", "swap"],
+                        "description": "Type of trade"
+                    },
+                    "symbol": {
+                        "type": "string",
+                        "description": "Trading symbol or market identifier"
+                    },
+                    "amount": {
+                        "type": "number",
+                        "description": "Amount to trade"
+                    },
+                    "price": {
+                        "type": "number",
+                        "description": "Limit price (optional for market orders)"
+                    },
+                    "slippage": {
+                        "type": "number",
+                        "description": "Acceptable slippage (0-1)"
+                    },
+                    "reasoning": {
+                        "type": "string",
+                        "description": "Reasoning for this trade"
+                    }
+                },
+                "required": ["platform", "trade_type", "symbol", "amount"]
+            }
+        }
+        self._functions = [self._trade_function]
+    
+    async def _batch_executor(self, items: list[tuple[str, str, float]]) -> list:
+        """Issue a window of analysis completions concurrently on the shared client."""
+        return await asyncio.gather(
+            *[
+                self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_message}
+                    ],
+                    temperature=temperature,
+                    extra_body=self._prompt_cache_body
+                )
+                for system_prompt, user_message, temperature in items
+            ],
+            return_exceptions=True
+        )
     
     async def analyze_market(
         self,
@@ -25,27 +116,33 @@ class OpenAIAgent(BaseAgent):
     ) -> dict:
         """Analyze market using OpenAI."""
         try:
-            system_prompt = self._build_system_prompt()
+            system_prompt = self._system_prompt
             market_context = self._build_trade_context(market_data)
             
             user_message = f"{market_context}\n\n{context}\n\nProvide market analysis and insights."
             
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=0.7
-            )
+            temperature = 0.7
             
-            analysis = response.choices[0].message.content
+            async def create_analysis() -> dict:
+                response = await self._batcher.run(
+                    (system_prompt, user_message, temperature)
+                )
+                
+                analysis = response.choices[0].message.content
+                
+                return {
+                    "analysis": analysis,
+                    "model": self.model,
+                    "tokens_used": response.usage.total_tokens if response.usage else 0
+                }
             
-            return {
-                "analysis": analysis,
-                "model": self.model,
-                "tokens_used": response.usage.total_tokens if response.usage else 0
-            }
+            return await self.cache.get_or_set(
+                self.model,
+                system_prompt,
+                user_message,
+                temperature,
+                create_analysis
+            )
             
         except Exception as e:
             return {"error": str(e)}
@@ -57,85 +154,52 @@ class OpenAIAgent(BaseAgent):
         context: str = ""
     ) -> Optional[TradeRequest]:
         """Generate trade decision using OpenAI with function calling."""
+        key = self._decision_key(market_data, portfolio, context)
+        if key == self._last_decision_key:
+            return self._last_decision
+        
         try:
-            system_prompt = self._build_system_prompt()
+            system_prompt = self._system_prompt
             market_context = self._build_trade_context(market_data, portfolio)
             
             user_message = f"{market_context}\n\n{context}\n\nShould we execute a trade? If yes, provide trade details."
             
-            # Define trade function schema
-            trade_function = {
-                "name": "execute_trade",
-                "description": "Execute a trade on a supported platform",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "platform": {
-                            "type": "string",
-                            "enum": [p.value for p in self.config.platforms],
-                            "description": "Trading platform"
-                        },
-                        "trade_type": {
-                            "type": "string",
-                            "enum": ["buy", "sell", "swap"],
-                            "description": "Type of trade"
-                        },
-                        "symbol": {
-                            "type": "string",
-                            "description": "Trading symbol or market identifier"
-                        },
-                        "amount": {
-                            "type": "number",
-                            "description": "Amount to trade"
-                        },
-                        "price": {
-                            "type": "number",
-                            "description": "Limit price (optional for market orders)"
-                        },
-                        "slippage": {
-                            "type": "number",
-                            "description": "Acceptable slippage (0-1)"
-                        },
-                        "reasoning": {
-                            "type": "string",
-                            "description": "Reasoning for this trade"
-                        }
-                    },
-                    "required": ["platform", "trade_type", "symbol", "amount"]
-                }
-            }
+            temperature = 0.3
             
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_message}
-                ],
-                functions=[trade_function],
-                function_call="auto",
-                temperature=0.3
-            )
+            async def create_decision() -> Optional[str]:
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_message}
+                    ],
+                    functions=self._functions,
+                    function_call="auto",
+                    temperature=temperature,
+                    extra_body=self._prompt_cache_body
+                )
+                
+                function_call = response.choices[0].message.function_call
+                return function_call.arguments if function_call else None
             
-            message = response.choices[0].message
+            arguments = await self.cache.get_or_set(
+                self.model,
+                system_prompt,
+                user_message,
+                temperature,
+                create_decision
+            )
             
             # Check if agent wants to execute a trade
-            if message.function_call:
-                args = json.loads(message.function_call.arguments)
+            if arguments:
+                args = orjson.loads(arguments)
                 
-                return TradeRequest(
-                    platform=Platform(args["platform"]),
-                    trade_type=TradeType(args["trade_type"]),
-                    symbol=args["symbol"],
-                    amount=args["amount"],
-                    price=args.get("price"),
-                    slippage=args.get("slippage", 0.01),
-                    metadata={"reasoning": args.get("reasoning", "")}
-                )
+                return self._remember_decision(key, self._build_trade_request(args))
             
-            return None
+            return self._remember_decision(key, None)
             
-        except Exception as e:
-            print(f"Error generating trade decision: {e}")
+        except Exception:
+            logger.exception("Error generating trade decision")
             return None
     
     async def stream_analysis(
@@ -145,7 +209,7 @@ class OpenAIAgent(BaseAgent):
     ) -> AsyncIterator[str]:
         """Stream analysis in real-time."""
         try:
-            system_prompt = self._build_system_prompt()
+            system_prompt = self._system_prompt
             market_context = self._build_trade_context(market_data)
             
             user_message = f"{market_context}\n\n{context}\n\nProvide detailed market analysis."
@@ -157,13 +221,19 @@ class OpenAIAgent(BaseAgent):
                     {"role": "user", "content": user_message}
                 ],
                 stream=True,
-                temperature=0.7
+                temperature=0.7,
+                extra_body=self._prompt_cache_body
             )
             
-            async for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+            deltas = (chunk.choices[0].delta.content async for chunk in stream)
+            
+            async with aclosing(self._stream_text(deltas)) as texts:
+                async for text in texts:
+                    yield text
                     
         except Exception as e:
             yield f"Error: {str(e)}"
-
+    
+    async def close(self) -> None:
+        """Stop the request batcher."""
+        await self._batcher.close()
@@ -0,0 +1,94 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
+import aiohttp
+import httpx
+
+
+class _AiohttpResponseStream(httpx.AsyncByteStream):
+    """Expose an aiohttp response body as an httpx byte stream."""
+
+    def __init__(self, response: aiohttp.ClientResponse):
+        self._response = response
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._response.content.iter_any():
+                yield chunk
+        except asyncio.TimeoutError as e:
+            raise httpx.ReadTimeout(str(e)) from e
+        except aiohttp.ClientError as e:
+            raise httpx.ReadError(str(e)) from e
+
+    async def aclose(self) -> None:
+        self._response.release()
+
+
+class AiohttpTransport(httpx.AsyncBaseTransport):
+    """httpx transport that sends requests over a shared aiohttp session.
+
+    Lets the provider SDKs, which are built on httpx, use aiohttp's
+    connection pool. The session is created on first use so the transport
+    can be built outside a running event loop.
+    """
+
+    def __init__(self, limit: int = 200, ttl_dns_cache: int = 300):
+        self.limit = limit
+        self.ttl_dns_cache = ttl_dns_cache
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the aiohttp session."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    ttl_dns_cache=self.ttl_dns_cache
+                ),
+                # httpx decodes the body itself based on Content-Encoding
+                auto_decompress=False
+            )
+        return self._session
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send an httpx request through aiohttp."""
+        timeouts = request.extensions.get("timeout", {})
+        timeout = aiohttp.ClientTimeout(
+            sock_connect=timeouts.get("connect"),
+            sock_read=timeouts.get("read")
+        )
+
+        try:
+            response = await self._get_session().request(
+                request.method,
+                str(request.url),
+                headers=request.headers.multi_items(),
+                data=await request.aread(),
+                timeout=timeout,
+                allow_redirects=False
+            )
+        except asyncio.TimeoutError as e:
+            raise httpx.ConnectTimeout(str(e), request=request) from e
+        except aiohttp.ClientConnectionError as e:
+            raise httpx.ConnectError(str(e), request=request) from e
+
+        return httpx.Response(
+            status_code=response.status,
+            headers=response.raw_headers,
+            stream=_AiohttpResponseStream(response),
+            request=request
+        )
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+
+# One transport is shared by every pooled provider client
+_TRANSPORT = AiohttpTransport()
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create an httpx client for a provider SDK on the shared transport."""
+    return httpx.AsyncClient(transport=_TRANSPORT)
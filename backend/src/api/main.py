@@ -1,25 +1,37 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from typing import Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Optional, AsyncIterator
+import logging
+import sys
 import uvicorn
+import zlib
 
 from ..config import settings
 from ..models import (
     TradeRequest,
     TradeResult,
     AgentConfig,
+    AnalyzeRequest,
+    TradeGenRequest,
     PlatformCredentials,
     Platform,
 )
 from ..routers import TradeRouter
-from ..agents import get_agent
+from ..agents import BaseAgent, get_agent, close_clients
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(levelname)s %(name)s %(message)s"
+)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Syrup Trading API",
     description="Agent-based trading interface for Solana, Polymarket, and Kalshi",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -31,11 +43,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses; SSE streams compress themselves per frame
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Global router instance
 trade_router = TradeRouter()
 
 # Store active agents
-active_agents: dict[str, any] = {}
+active_agents: dict[str, BaseAgent] = {}
+
+
+async def gzip_stream(frames: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Gzip a byte stream, flushing after each frame so it is sent immediately."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    
+    async for frame in frames:
+        yield compressor.compress(frame) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    
+    yield compressor.flush()
+
+
+def get_active_agent(agent_name: str) -> BaseAgent:
+    """Look up an active agent, raising 404 if it does not exist."""
+    agent = active_agents.get(agent_name)
+    if not agent:
+        raise HTTPException(status_code=404, detail=f"Agent {agent_name} not found")
+    return agent
 
 
 @app.get("/")
@@ -136,6 +169,11 @@ async def create_agent(config: AgentConfig):
     """Create and register a new agent."""
     try:
         agent = get_agent(config)
+        
+        previous = active_agents.get(config.name)
+        if previous:
+            await previous.close()
+        
         active_agents[config.name] = agent
         
         return {
@@ -149,18 +187,12 @@ async def create_agent(config: AgentConfig):
 
 
 @app.post("/api/agent/{agent_name}/analyze")
-async def analyze_market(
-    agent_name: str,
-    market_data: dict,
-    context: str = ""
-):
+async def analyze_market(agent_name: str, body: AnalyzeRequest):
     """Get market analysis from an agent."""
-    agent = active_agents.get(agent_name)
-    if not agent:
-        raise HTTPException(status_code=404, detail=f"Agent {agent_name} not found")
+    agent = get_active_agent(agent_name)
     
     try:
-        analysis = await agent.analyze_market(market_data, context)
+        analysis = await agent.analyze_market(body.market_data, body.context)
         return {
             "success": True,
             "agent": agent_name,
@@ -171,23 +203,15 @@ async def analyze_market(
 
 
 @app.post("/api/agent/{agent_name}/trade")
-async def agent_generate_trade(
-    agent_name: str,
-    market_data: dict,
-    portfolio: dict,
-    context: str = "",
-    execute: bool = False
-):
+async def agent_generate_trade(agent_name: str, body: TradeGenRequest):
     """Generate trade decision from an agent."""
-    agent = active_agents.get(agent_name)
-    if not agent:
-        raise HTTPException(status_code=404, detail=f"Agent {agent_name} not found")
+    agent = get_active_agent(agent_name)
     
     try:
         trade_request = await agent.generate_trade_decision(
-            market_data,
-            portfolio,
-            context
+            body.market_data,
+            body.portfolio,
+            body.context
         )
         
         if not trade_request:
@@ -199,7 +223,7 @@ async def agent_generate_trade(
             }
         
         result = None
-        if execute:
+        if body.execute:
             result = await trade_router.execute_trade(trade_request)
         
         return {
@@ -215,23 +239,31 @@ async def agent_generate_trade(
 
 @app.get("/api/agent/{agent_name}/stream")
 async def stream_analysis(
+    request: Request,
     agent_name: str,
     market_data: dict,
     context: str = ""
 ):
     """Stream market analysis from an agent."""
-    agent = active_agents.get(agent_name)
-    if not agent:
-        raise HTTPException(status_code=404, detail=f"Agent {agent_name} not found")
+    agent = get_active_agent(agent_name)
     
     async def generate():
         try:
             async for chunk in agent.stream_analysis(market_data, context):
-                yield f"data: {chunk}\n\n"
+                yield b"data: " + chunk.encode() + b"\n\n"
         except Exception as e:
-            yield f"data: Error: {str(e)}\n\n"
+            yield f"data: Error: {str(e)}\n\n".encode()
+    
+    # Keep proxies from buffering the event stream
+    headers = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    body = generate()
     
-    return StreamingResponse(generate(), media_type="text/event-stream")
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+        body = gzip_stream(body)
+    
+    return StreamingResponse(body, media_type="text/event-stream", headers=headers)
 
 
 @app.get("/api/agents")
@@ -253,10 +285,9 @@ async def list_agents():
 @app.delete("/api/agent/{agent_name}")
 async def delete_agent(agent_name: str):
     """Delete an agent."""
-    if agent_name not in active_agents:
-        raise HTTPException(status_code=404, detail=f"Agent {agent_name} not found")
-    
+    agent = get_active_agent(agent_name)
     del active_agents[agent_name]
+    await agent.close()
     
     return {
         "success": True,
@@ -268,15 +299,28 @@ async def delete_agent(agent_name: str):
 async def shutdown_event():
     """Cleanup on shutdown."""
     await trade_router.close_all()
+    
+    for agent in active_agents.values():
+        await agent.close()
+    
+    await close_clients()
 
 
 def start():
     """Start the API server."""
+    # Reload mode only supports a single worker process
+    workers = 1 if settings.api_reload else settings.api_workers
+    
     uvicorn.run(
         "src.api.main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=settings.api_reload
+        reload=settings.api_reload,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        log_level="info",
+        access_log=False
     )
 
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -8,10 +9,13 @@ class Settings(BaseSettings):
     # API Configuration
     api_host: str = "0.0.0.0"
     api_port: int = 8000
-    api_reload: bool = True
+    api_reload: bool = False
+    # Agents and platforms are held in process memory, so extra workers
+    # only suit deployments with sticky routing
+    api_workers: int = 1
     
     # CORS
-    cors_origins: list[str] = ["http://localhost:3000"]
+    cors_origins: tuple[str, ...] = ("http://localhost:3000",)
     
     # Solana
     solana_rpc_url: Optional[str] = None
@@ -35,5 +39,11 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings once; call get_settings.cache_clear() to reload."""
+    return Settings()
+
+
+settings = get_settings()
 
@@ -5,6 +5,8 @@ from .trade import (
     TradeRequest,
     TradeResult,
     AgentConfig,
+    AnalyzeRequest,
+    TradeGenRequest,
     PlatformCredentials,
 )
 
@@ -15,6 +17,8 @@ __all__ = [
     "TradeRequest",
     "TradeResult",
     "AgentConfig",
+    "AnalyzeRequest",
+    "TradeGenRequest",
     "PlatformCredentials",
 ]
 
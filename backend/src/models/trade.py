@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, SecretStr
 from typing import Optional, Literal
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
 
@@ -29,6 +29,8 @@ class TradeStatus(str, Enum):
 
 class TradeRequest(BaseModel):
     """Trade request from agent."""
+    model_config = ConfigDict(frozen=True)
+    
     platform: Platform
     trade_type: TradeType
     symbol: str
@@ -40,20 +42,26 @@ class TradeRequest(BaseModel):
 
 class TradeResult(BaseModel):
     """Result of a trade execution."""
+    model_config = ConfigDict(frozen=True)
+    
     trade_id: str
     platform: Platform
     status: TradeStatus
     transaction_hash: Optional[str] = None
     executed_amount: Optional[float] = None
     executed_price: Optional[float] = None
+    # Exact fill price for platforms that quote in integer cents
+    executed_price_cents: Optional[int] = None
     fee: Optional[float] = None
-    timestamp: datetime
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     error: Optional[str] = None
     metadata: dict = Field(default_factory=dict)
 
 
 class AgentConfig(BaseModel):
     """Configuration for trading agent."""
+    model_config = ConfigDict(frozen=True)
+    
     name: str
     agent_type: Literal["openai", "anthropic", "custom"]
     api_key: Optional[str] = None
@@ -61,18 +69,38 @@ class AgentConfig(BaseModel):
     system_prompt: str = "You are a trading agent."
     max_position_size: float = 1000.0
     risk_limit: float = 0.1
+    cache_max_temperature: float = 0.0
     platforms: list[Platform] = Field(default_factory=list)
     metadata: dict = Field(default_factory=dict)
 
 
+class AnalyzeRequest(BaseModel):
+    """Request body for agent market analysis."""
+    market_data: dict
+    context: str = ""
+
+
+class TradeGenRequest(BaseModel):
+    """Request body for an agent trade decision."""
+    market_data: dict
+    portfolio: dict
+    context: str = ""
+    execute: bool = False
+
+
 class PlatformCredentials(BaseModel):
     """Credentials for a specific platform."""
+    model_config = ConfigDict(frozen=True)
+    
     platform: Platform
     rpc_url: Optional[str] = None
     api_key: Optional[str] = None
-    secret: Optional[str] = None
-    private_key: Optional[str] = None
-    passphrase: Optional[str] = None
+    # Secrets are masked in repr and logs; adapters unwrap them where used
+    secret: Optional[SecretStr] = None
+    private_key: Optional[SecretStr] = None
+    passphrase: Optional[SecretStr] = None
     wallet_address: Optional[str] = None
+    # Cap on concurrent HTTP requests to the platform; adapter default if unset
+    max_concurrency: Optional[int] = Field(default=None, gt=0)
     metadata: dict = Field(default_factory=dict)
 
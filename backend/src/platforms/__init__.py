@@ -1,3 +1,6 @@
+from typing import Optional
+import aiohttp
+
 from .base import BasePlatform
 from .solana_adapter import SolanaAdapter
 from .polymarket_adapter import PolymarketAdapter
@@ -5,7 +8,10 @@ from .kalshi_adapter import KalshiAdapter
 from ..models import Platform, PlatformCredentials
 
 
-def get_platform_adapter(credentials: PlatformCredentials) -> BasePlatform:
+def get_platform_adapter(
+    credentials: PlatformCredentials,
+    shared_session: Optional[aiohttp.ClientSession] = None
+) -> BasePlatform:
     """Factory function to get appropriate platform adapter."""
     adapters = {
         Platform.SOLANA: SolanaAdapter,
@@ -17,7 +23,7 @@ def get_platform_adapter(credentials: PlatformCredentials) -> BasePlatform:
     if not adapter_class:
         raise ValueError(f"Unsupported platform: {credentials.platform}")
     
-    return adapter_class(credentials)
+    return adapter_class(credentials, shared_session)
 
 
 __all__ = [
@@ -1,15 +1,142 @@
+import asyncio
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Awaitable, Callable, Hashable, Optional, Union
+import aiohttp
+import orjson
+from pydantic import SecretStr
 from ..models import TradeRequest, TradeResult, PlatformCredentials
 
 
 class BasePlatform(ABC):
     """Base class for trading platform adapters."""
     
-    def __init__(self, credentials: PlatformCredentials):
+    # HTTP API root for adapters that talk to the shared aiohttp session
+    BASE_URL: Optional[str] = None
+    
+    # Bounds every HTTP call so a hung endpoint can't stall an agent loop
+    REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3, sock_read=8)
+    
+    # Transient failures are retried with exponential backoff. 5xx responses
+    # are only retried for idempotent methods so an order is never placed twice.
+    RETRY_ATTEMPTS = 3
+    RETRY_BACKOFF = 0.1
+    RETRY_MAX_DELAY = 5.0
+    RETRY_STATUSES = frozenset({500, 502, 503, 504})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+    
+    # Default cap on concurrent HTTP requests, sized to platform rate limits
+    MAX_CONCURRENCY = 20
+    
+    def __init__(
+        self,
+        credentials: PlatformCredentials,
+        shared_session: Optional[aiohttp.ClientSession] = None
+    ):
         self.credentials = credentials
+        # HTTP adapters use this session when given instead of their own
+        self.shared_session = shared_session
+        # Short-lived lookup results: key -> (value, expiry)
+        self._ttl_cache: dict[Hashable, tuple[Any, float]] = {}
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self._sem = asyncio.Semaphore(
+            credentials.max_concurrency or self.MAX_CONCURRENCY
+        )
         self._initialize()
     
+    @staticmethod
+    def _reveal(secret: Optional[SecretStr]) -> str:
+        """Get a credential secret's plaintext, or "" if unset."""
+        return secret.get_secret_value() if secret else ""
+    
+    @staticmethod
+    async def _read_json(response: aiohttp.ClientResponse) -> dict:
+        """Decode a JSON response body with orjson."""
+        body = await response.read()
+        return orjson.loads(body) if body else {}
+    
+    async def _send(
+        self,
+        session: aiohttp.ClientSession,
+        method: str,
+        url: Any,
+        **kwargs: Any
+    ) -> tuple[int, dict]:
+        """Send a request, retrying 429s and transient 5xx responses.
+        
+        At most `max_concurrency` requests are in flight per adapter; the
+        slot is released during backoff. Returns the final status and
+        decoded JSON body.
+        """
+        for attempt in range(self.RETRY_ATTEMPTS):
+            async with self._sem, session.request(method, url, **kwargs) as response:
+                status = response.status
+                retryable = status == 429 or (
+                    status in self.RETRY_STATUSES
+                    and method in self.IDEMPOTENT_METHODS
+                )
+                
+                if not retryable or attempt == self.RETRY_ATTEMPTS - 1:
+                    return status, await self._read_json(response)
+                
+                delay = self._retry_delay(response, attempt)
+            
+            await asyncio.sleep(delay)
+    
+    def _retry_delay(self, response: aiohttp.ClientResponse, attempt: int) -> float:
+        """Seconds to wait before a retry, honouring Retry-After if sent."""
+        delay = self.RETRY_BACKOFF * 2 ** attempt
+        
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                pass
+        
+        return min(delay, self.RETRY_MAX_DELAY)
+    
+    async def _memoize(
+        self,
+        key: Hashable,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return a value cached for ttl seconds, sharing one fetch per key.
+        
+        Concurrent callers for the same key await a single in-flight fetch.
+        Failed fetches raise to every waiter and are not cached.
+        """
+        entry = self._ttl_cache.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            return entry[0]
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fill(key, ttl, fetch))
+            self._inflight[key] = task
+        
+        # Shield so one cancelled caller doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+    
+    async def _fill(
+        self,
+        key: Hashable,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run a fetch and store its result in the TTL cache."""
+        try:
+            value = await fetch()
+            self._ttl_cache[key] = (value, time.monotonic() + ttl)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+    
+    def _invalidate(self, key: Hashable) -> None:
+        """Drop a cached value so the next lookup refetches it."""
+        self._ttl_cache.pop(key, None)
+    
     @abstractmethod
     def _initialize(self) -> None:
         """Initialize platform-specific connections."""
@@ -20,6 +147,21 @@ class BasePlatform(ABC):
         """Execute a trade on the platform."""
         pass
     
+    async def execute_trades(
+        self,
+        trades: list[TradeRequest]
+    ) -> list[Union[TradeResult, BaseException]]:
+        """Execute several trades on the platform.
+        
+        Returns one result per trade, in order; an exception in place of a
+        result fails that trade only. Runs the trades concurrently by
+        default; adapters with a batch order API can override this.
+        """
+        return await asyncio.gather(
+            *(self.execute_trade(trade) for trade in trades),
+            return_exceptions=True
+        )
+    
     @abstractmethod
     async def get_balance(self, token: Optional[str] = None) -> dict[str, float]:
         """Get account balance(s)."""
@@ -42,17 +184,17 @@ class BasePlatform(ABC):
     
     async def validate_trade(self, trade: TradeRequest) -> tuple[bool, Optional[str]]:
         """Validate trade parameters before execution."""
+        # Basic validation runs first so rejected trades skip the round trip
+        if trade.amount <= 0:
+            return False, "Amount must be positive"
+        
+        if trade.slippage < 0 or trade.slippage > 1:
+            return False, "Slippage must be between 0 and 1"
+        
         try:
-            # Check balance
+            # Check balance (served from the short-lived cache when warm)
             balances = await self.get_balance()
             
-            # Basic validation
-            if trade.amount <= 0:
-                return False, "Amount must be positive"
-            
-            if trade.slippage < 0 or trade.slippage > 1:
-                return False, "Slippage must be between 0 and 1"
-            
             return True, None
         except Exception as e:
             return False, f"Validation error: {str(e)}"
@@ -1,11 +1,16 @@
 import asyncio
+import time
 from typing import Optional
-from datetime import datetime
 import aiohttp
 import base64
+import orjson
+import yarl
 
 from .base import BasePlatform
-from ..models import TradeRequest, TradeResult, TradeStatus, Platform
+from ..models import TradeRequest, TradeResult, TradeStatus, TradeType, Platform
+
+_PLATFORM = Platform.KALSHI
+_ACTIONS = {trade_type: trade_type.value.upper() for trade_type in TradeType}
 
 
 class KalshiAdapter(BasePlatform):
@@ -13,17 +18,33 @@ class KalshiAdapter(BasePlatform):
     
     BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
     
+    # Login tokens are treated as valid for this long, and refreshed
+    # this many seconds before they would expire
+    TOKEN_TTL = 1800
+    TOKEN_REFRESH_MARGIN = 30
+    
+    # Seconds that price and balance lookups are served from cache
+    PRICE_TTL = 0.5
+    BALANCE_TTL = 1.0
+    
     def _initialize(self) -> None:
         """Initialize Kalshi connection."""
         self.api_key = self.credentials.api_key
-        self.private_key = self.credentials.private_key
         self.session: Optional[aiohttp.ClientSession] = None
         self.token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._auth_lock = asyncio.Lock()
+        self._base_url = yarl.URL(self.BASE_URL)
+        # Rebuilt only when the token changes
+        self._headers = {"Content-Type": "application/json"}
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
+        """Get the shared session, or create a private one."""
+        if self.shared_session is not None:
+            return self.shared_session
+        
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(timeout=self.REQUEST_TIMEOUT)
         return self.session
     
     async def _authenticate(self) -> bool:
@@ -33,17 +54,23 @@ class KalshiAdapter(BasePlatform):
             
             auth_data = {
                 "email": self.api_key,
-                "password": self.private_key  # In production, use proper key management
+                "password": self._reveal(self.credentials.private_key)  # In production, use proper key management
             }
             
             async with session.post(
-                f"{self.BASE_URL}/login",
-                json=auth_data
+                self._base_url / "login",
+                data=orjson.dumps(auth_data),
+                headers={"Content-Type": "application/json"}
             ) as response:
-                data = await response.json()
+                data = await self._read_json(response)
                 
                 if data.get("token"):
                     self.token = data["token"]
+                    self._headers = {
+                        "Authorization": "Bearer " + self.token,
+                        "Content-Type": "application/json"
+                    }
+                    self._token_expires_at = time.monotonic() + self.TOKEN_TTL
                     return True
             
             return False
@@ -56,114 +83,136 @@ class KalshiAdapter(BasePlatform):
         endpoint: str,
         data: Optional[dict] = None
     ) -> dict:
-        """Make authenticated API request."""
-        if not self.token:
-            await self._authenticate()
-        
-        session = await self._get_session()
-        url = f"{self.BASE_URL}{endpoint}"
-        
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json"
-        }
-        
-        async with session.request(
-            method,
-            url,
-            headers=headers,
-            json=data
-        ) as response:
-            return await response.json()
-    
-    async def execute_trade(self, trade: TradeRequest) -> TradeResult:
-        """Execute trade on Kalshi."""
+        """Make authenticated API request, re-authenticating once on 401."""
         try:
-            # Validate trade
-            is_valid, error = await self.validate_trade(trade)
-            if not is_valid:
-                return TradeResult(
-                    trade_id="",
-                    platform=Platform.KALSHI,
-                    status=TradeStatus.FAILED,
-                    timestamp=datetime.utcnow(),
-                    error=error
-                )
+            await self._ensure_token()
             
-            # Create order
-            order_data = {
-                "ticker": trade.symbol,
-                "action": trade.trade_type.value.upper(),
-                "count": int(trade.amount),
-                "type": "market",
-                "side": "yes"  # Can be customized via metadata
-            }
-            
-            if trade.price:
-                order_data["type"] = "limit"
-                order_data["yes_price"] = int(trade.price * 100)  # Convert to cents
-            
-            response = await self._make_request("POST", "/portfolio/orders", order_data)
+            session = await self._get_session()
+            url = self._base_url / endpoint.lstrip("/")
+            body = orjson.dumps(data) if data is not None else None
             
-            if response.get("order"):
-                order = response["order"]
-                return TradeResult(
-                    trade_id=order.get("order_id", ""),
-                    platform=Platform.KALSHI,
-                    status=TradeStatus.COMPLETED,
-                    executed_amount=order.get("quantity", 0),
-                    executed_price=order.get("yes_price", 0) / 100,
-                    fee=order.get("fee", 0) / 100,
-                    timestamp=datetime.utcnow()
+            for attempt in range(2):
+                token = self.token
+                
+                status, payload = await self._send(
+                    session,
+                    method,
+                    url,
+                    headers=self._headers,
+                    data=body
                 )
-            
+                if status != 401 or attempt:
+                    return payload
+                
+                # Drop the rejected token unless another request already replaced it
+                if self.token == token:
+                    self.token = None
+                await self._ensure_token()
+        except asyncio.TimeoutError:
+            return {"error": "timeout"}
+    
+    def _token_is_fresh(self) -> bool:
+        """Check whether the cached token can still be used."""
+        return (
+            self.token is not None
+            and time.monotonic() < self._token_expires_at - self.TOKEN_REFRESH_MARGIN
+        )
+    
+    async def _ensure_token(self) -> None:
+        """Log in if the token is missing or about to expire."""
+        if self._token_is_fresh():
+            return
+        
+        # Concurrent callers wait for a single login instead of racing
+        async with self._auth_lock:
+            if not self._token_is_fresh():
+                await self._authenticate()
+    
+    async def execute_trade(self, trade: TradeRequest) -> TradeResult:
+        """Execute trade on Kalshi."""
+        # Validate trade
+        is_valid, error = await self.validate_trade(trade)
+        if not is_valid:
             return TradeResult(
                 trade_id="",
-                platform=Platform.KALSHI,
+                platform=_PLATFORM,
                 status=TradeStatus.FAILED,
-                timestamp=datetime.utcnow(),
-                error=response.get("error", "Unknown error")
+                error=error
             )
-            
-        except Exception as e:
+        
+        # Create order
+        order_data = {
+            "ticker": trade.symbol,
+            "action": _ACTIONS[trade.trade_type],
+            "count": int(trade.amount),
+            "type": "market",
+            "side": "yes"  # Can be customized via metadata
+        }
+        
+        if trade.price:
+            order_data["type"] = "limit"
+            # round() rather than int() so e.g. 0.57 maps to 57, not 56
+            order_data["yes_price"] = round(trade.price * 100)
+        
+        response = await self._make_request("POST", "/portfolio/orders", order_data)
+        self._invalidate("balance")
+        
+        if response.get("order"):
+            order = response["order"]
+            price_cents = order.get("yes_price", 0)
             return TradeResult(
-                trade_id="",
-                platform=Platform.KALSHI,
-                status=TradeStatus.FAILED,
-                timestamp=datetime.utcnow(),
-                error=str(e)
+                trade_id=order.get("order_id", ""),
+                platform=_PLATFORM,
+                status=TradeStatus.COMPLETED,
+                executed_amount=order.get("quantity", 0),
+                executed_price=price_cents / 100,
+                executed_price_cents=price_cents,
+                fee=order.get("fee", 0) / 100
             )
+        
+        return TradeResult(
+            trade_id="",
+            platform=_PLATFORM,
+            status=TradeStatus.FAILED,
+            error=response.get("error", "Unknown error")
+        )
     
     async def get_balance(self, token: Optional[str] = None) -> dict[str, float]:
         """Get account balance."""
-        try:
-            response = await self._make_request("GET", "/portfolio/balance")
-            
-            if response.get("balance"):
-                balance = response["balance"] / 100  # Convert cents to dollars
-                return {"USD": balance}
-            
-            return {}
-        except Exception:
-            return {}
+        return await self._memoize("balance", self.BALANCE_TTL, self._fetch_balance)
+    
+    async def _fetch_balance(self) -> dict[str, float]:
+        """Fetch account balance from the API."""
+        response = await self._make_request("GET", "/portfolio/balance")
+        
+        if response.get("balance"):
+            balance = response["balance"] / 100  # Convert cents to dollars
+            return {"USD": balance}
+        
+        return {}
     
     async def get_price(self, symbol: str) -> float:
         """Get current market price."""
-        try:
-            response = await self._make_request("GET", f"/markets/{symbol}")
-            
-            if response.get("market"):
-                market = response["market"]
-                return market.get("last_price", 0) / 100
-            
-            return 0.0
-        except Exception:
-            return 0.0
+        return await self._memoize(
+            ("price", symbol),
+            self.PRICE_TTL,
+            lambda: self._fetch_price(symbol)
+        )
+    
+    async def _fetch_price(self, symbol: str) -> float:
+        """Fetch current market price from the API."""
+        response = await self._make_request("GET", "/markets/" + symbol)
+        
+        if response.get("market"):
+            market = response["market"]
+            return market.get("last_price", 0) / 100
+        
+        return 0.0
     
     async def get_order_status(self, order_id: str) -> dict:
         """Get order status."""
         try:
-            response = await self._make_request("GET", f"/portfolio/orders/{order_id}")
+            response = await self._make_request("GET", "/portfolio/orders/" + order_id)
             return response
         except Exception as e:
             return {"error": str(e)}
@@ -171,13 +220,13 @@ class KalshiAdapter(BasePlatform):
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an order."""
         try:
-            response = await self._make_request("DELETE", f"/portfolio/orders/{order_id}")
+            response = await self._make_request("DELETE", "/portfolio/orders/" + order_id)
             return response.get("order", {}).get("status") == "canceled"
         except Exception:
             return False
     
     async def close(self):
-        """Close session."""
+        """Close the private session; the shared one belongs to the router."""
         if self.session and not self.session.closed:
             await self.session.close()
 
@@ -3,11 +3,14 @@ import hmac
 import hashlib
 import time
 from typing import Optional
-from datetime import datetime
 import aiohttp
+import orjson
+import yarl
 
 from .base import BasePlatform
-from ..models import TradeRequest, TradeResult, TradeStatus, Platform
+from ..models import TradeRequest, TradeResult, TradeStatus, TradeType, Platform
+
+_PLATFORM = Platform.POLYMARKET
 
 
 class PolymarketAdapter(BasePlatform):
@@ -15,17 +18,34 @@ class PolymarketAdapter(BasePlatform):
     
     BASE_URL = "https://api.polymarket.com"
     
+    # Seconds that price and balance lookups are served from cache
+    PRICE_TTL = 0.5
+    BALANCE_TTL = 1.0
+    
     def _initialize(self) -> None:
         """Initialize Polymarket connection."""
         self.api_key = self.credentials.api_key
-        self.secret = self.credentials.secret
-        self.passphrase = self.credentials.passphrase
         self.session: Optional[aiohttp.ClientSession] = None
+        self._base_url = yarl.URL(self.BASE_URL)
+        # Only the signature and timestamp change between requests
+        self._base_headers = {
+            "POLY-API-KEY": self.api_key or "",
+            "POLY-PASSPHRASE": self._reveal(self.credentials.passphrase),
+            "Content-Type": "application/json"
+        }
+        # Keyed HMAC state is derived once and copied for each signature
+        self._hmac_template = hmac.new(
+            self._reveal(self.credentials.secret).encode(),
+            digestmod=hashlib.sha256
+        )
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
+        """Get the shared session, or create a private one."""
+        if self.shared_session is not None:
+            return self.shared_session
+        
         if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession()
+            self.session = aiohttp.ClientSession(timeout=self.REQUEST_TIMEOUT)
         return self.session
     
     def _generate_signature(
@@ -33,16 +53,13 @@ class PolymarketAdapter(BasePlatform):
         timestamp: str,
         method: str,
         path: str,
-        body: str = ""
+        body: bytes = b""
     ) -> str:
         """Generate HMAC signature for Polymarket API."""
-        message = timestamp + method + path + body
-        signature = hmac.new(
-            self.secret.encode() if self.secret else b"",
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
+        mac = self._hmac_template.copy()
+        mac.update((timestamp + method + path).encode())
+        mac.update(body)
+        return mac.hexdigest()
     
     async def _make_request(
         self,
@@ -52,110 +69,102 @@ class PolymarketAdapter(BasePlatform):
     ) -> dict:
         """Make authenticated API request."""
         session = await self._get_session()
-        url = f"{self.BASE_URL}{endpoint}"
+        url = self._base_url / endpoint.lstrip("/")
         
         timestamp = str(int(time.time()))
-        body = ""
-        if data:
-            import json
-            body = json.dumps(data)
+        body = orjson.dumps(data) if data else b""
         
         signature = self._generate_signature(timestamp, method, endpoint, body)
         
         headers = {
-            "POLY-API-KEY": self.api_key or "",
+            **self._base_headers,
             "POLY-SIGNATURE": signature,
-            "POLY-TIMESTAMP": timestamp,
-            "POLY-PASSPHRASE": self.passphrase or "",
-            "Content-Type": "application/json"
+            "POLY-TIMESTAMP": timestamp
         }
         
-        async with session.request(method, url, headers=headers, json=data) as response:
-            return await response.json()
+        # Send exactly the body that was signed
+        try:
+            _, payload = await self._send(session, method, url, headers=headers, data=body or None)
+            return payload
+        except asyncio.TimeoutError:
+            return {"error": "timeout"}
     
     async def execute_trade(self, trade: TradeRequest) -> TradeResult:
         """Execute trade on Polymarket."""
-        try:
-            # Validate trade
-            is_valid, error = await self.validate_trade(trade)
-            if not is_valid:
-                return TradeResult(
-                    trade_id="",
-                    platform=Platform.POLYMARKET,
-                    status=TradeStatus.FAILED,
-                    timestamp=datetime.utcnow(),
-                    error=error
-                )
-            
-            # Create order
-            order_data = {
-                "market": trade.symbol,
-                "side": "BUY" if trade.trade_type.value == "buy" else "SELL",
-                "size": trade.amount,
-                "price": trade.price,
-                "type": "LIMIT" if trade.price else "MARKET"
-            }
-            
-            response = await self._make_request("POST", "/orders", order_data)
-            
-            if response.get("success"):
-                return TradeResult(
-                    trade_id=response.get("orderId", ""),
-                    platform=Platform.POLYMARKET,
-                    status=TradeStatus.COMPLETED,
-                    transaction_hash=response.get("transactionHash"),
-                    executed_amount=trade.amount,
-                    executed_price=response.get("executedPrice"),
-                    fee=response.get("fee", 0),
-                    timestamp=datetime.utcnow()
-                )
-            
+        # Validate trade
+        is_valid, error = await self.validate_trade(trade)
+        if not is_valid:
             return TradeResult(
                 trade_id="",
-                platform=Platform.POLYMARKET,
+                platform=_PLATFORM,
                 status=TradeStatus.FAILED,
-                timestamp=datetime.utcnow(),
-                error=response.get("error", "Unknown error")
+                error=error
             )
-            
-        except Exception as e:
+        
+        # Create order
+        order_data = {
+            "market": trade.symbol,
+            "side": "BUY" if trade.trade_type is TradeType.BUY else "SELL",
+            "size": trade.amount,
+            "price": trade.price,
+            "type": "LIMIT" if trade.price else "MARKET"
+        }
+        
+        response = await self._make_request("POST", "/orders", order_data)
+        self._invalidate("balance")
+        
+        if response.get("success"):
             return TradeResult(
-                trade_id="",
-                platform=Platform.POLYMARKET,
-                status=TradeStatus.FAILED,
-                timestamp=datetime.utcnow(),
-                error=str(e)
+                trade_id=response.get("orderId", ""),
+                platform=_PLATFORM,
+                status=TradeStatus.COMPLETED,
+                transaction_hash=response.get("transactionHash"),
+                executed_amount=trade.amount,
+                executed_price=response.get("executedPrice"),
+                fee=response.get("fee", 0)
             )
+        
+        return TradeResult(
+            trade_id="",
+            platform=_PLATFORM,
+            status=TradeStatus.FAILED,
+            error=response.get("error", "Unknown error")
+        )
     
     async def get_balance(self, token: Optional[str] = None) -> dict[str, float]:
         """Get account balances."""
-        try:
-            response = await self._make_request("GET", "/balances")
-            
-            if response.get("success"):
-                balances = response.get("balances", {})
-                return balances
-            
-            return {}
-        except Exception:
-            return {}
+        return await self._memoize("balance", self.BALANCE_TTL, self._fetch_balance)
+    
+    async def _fetch_balance(self) -> dict[str, float]:
+        """Fetch account balances from the API."""
+        response = await self._make_request("GET", "/balances")
+        
+        if response.get("success"):
+            return response.get("balances", {})
+        
+        return {}
     
     async def get_price(self, symbol: str) -> float:
         """Get current market price."""
-        try:
-            response = await self._make_request("GET", f"/markets/{symbol}")
-            
-            if response.get("success"):
-                return float(response.get("lastPrice", 0))
-            
-            return 0.0
-        except Exception:
-            return 0.0
+        return await self._memoize(
+            ("price", symbol),
+            self.PRICE_TTL,
+            lambda: self._fetch_price(symbol)
+        )
+    
+    async def _fetch_price(self, symbol: str) -> float:
+        """Fetch current market price from the API."""
+        response = await self._make_request("GET", "/markets/" + symbol)
+        
+        if response.get("success"):
+            return float(response.get("lastPrice", 0))
+        
+        return 0.0
     
     async def get_order_status(self, order_id: str) -> dict:
         """Get order status."""
         try:
-            response = await self._make_request("GET", f"/orders/{order_id}")
+            response = await self._make_request("GET", "/orders/" + order_id)
             return response
         except Exception as e:
             return {"error": str(e)}
@@ -163,13 +172,13 @@ class PolymarketAdapter(BasePlatform):
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel an order."""
         try:
-            response = await self._make_request("DELETE", f"/orders/{order_id}")
+            response = await self._make_request("DELETE", "/orders/" + order_id)
             return response.get("success", False)
         except Exception:
             return False
     
     async def close(self):
-        """Close session."""
+        """Close the private session; the shared one belongs to the router."""
         if self.session and not self.session.closed:
             await self.session.close()
 
@@ -1,20 +1,27 @@
 import asyncio
 from typing import Optional
-from datetime import datetime
+import httpx
 from solana.rpc.async_api import AsyncClient
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solana.rpc.commitment import Confirmed
+from solana.rpc.types import TokenAccountOpts
 from solana.transaction import Transaction
+from spl.token.constants import TOKEN_PROGRAM_ID
 import base58
 
 from .base import BasePlatform
 from ..models import TradeRequest, TradeResult, TradeStatus, TradeType, Platform
 
+_PLATFORM = Platform.SOLANA
+
 
 class SolanaAdapter(BasePlatform):
     """Solana blockchain trading adapter with Jupiter aggregator support."""
     
+    RPC_TIMEOUT = 10
+    RPC_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+    
     def _initialize(self) -> None:
         """Initialize Solana connection."""
         self.rpc_url = self.credentials.rpc_url or "https://api.mainnet-beta.solana.com"
@@ -24,90 +31,87 @@ class SolanaAdapter(BasePlatform):
         if self.credentials.private_key:
             try:
                 # Decode base58 private key
-                private_key_bytes = base58.b58decode(self.credentials.private_key)
+                private_key_bytes = base58.b58decode(self._reveal(self.credentials.private_key))
                 self.wallet = Keypair.from_bytes(private_key_bytes)
             except Exception as e:
                 raise ValueError(f"Invalid Solana private key: {e}")
+        
+        self._pubkey: Optional[Pubkey] = self.wallet.pubkey() if self.wallet else None
     
     async def _get_client(self) -> AsyncClient:
         """Get or create async client."""
         if self.client is None:
-            self.client = AsyncClient(self.rpc_url)
+            self.client = AsyncClient(
+                self.rpc_url,
+                commitment=Confirmed,
+                timeout=self.RPC_TIMEOUT
+            )
+            # Swap in a bounded keep-alive pool so the RPC connection
+            # stays warm across calls
+            self.client._provider.session = httpx.AsyncClient(
+                timeout=self.RPC_TIMEOUT,
+                limits=self.RPC_LIMITS
+            )
         return self.client
     
     async def execute_trade(self, trade: TradeRequest) -> TradeResult:
         """Execute trade on Solana via Jupiter aggregator."""
-        try:
-            if not self.wallet:
-                return TradeResult(
-                    trade_id="",
-                    platform=Platform.SOLANA,
-                    status=TradeStatus.FAILED,
-                    timestamp=datetime.utcnow(),
-                    error="Wallet not initialized"
-                )
+        if not self.wallet:
+            return TradeResult(
+                trade_id="",
+                platform=_PLATFORM,
+                status=TradeStatus.FAILED,
+                error="Wallet not initialized"
+            )
+        
+        # Validate trade
+        is_valid, error = await self.validate_trade(trade)
+        if not is_valid:
+            return TradeResult(
+                trade_id="",
+                platform=_PLATFORM,
+                status=TradeStatus.FAILED,
+                error=error
+            )
+        
+        client = await self._get_client()
+        
+        # In production, integrate with Jupiter API for swap quotes
+        # This is a simplified version showing the structure
+        if trade.trade_type is TradeType.SWAP:
+            quote = await self._get_jupiter_quote(
+                trade.symbol,
+                trade.amount,
+                trade.slippage
+            )
             
-            # Validate trade
-            is_valid, error = await self.validate_trade(trade)
-            if not is_valid:
+            if not quote:
                 return TradeResult(
                     trade_id="",
-                    platform=Platform.SOLANA,
+                    platform=_PLATFORM,
                     status=TradeStatus.FAILED,
-                    timestamp=datetime.utcnow(),
-                    error=error
+                    error="Failed to get quote"
                 )
             
-            client = await self._get_client()
+            # Execute swap
+            tx_signature = await self._execute_jupiter_swap(quote)
             
-            # In production, integrate with Jupiter API for swap quotes
-            # This is a simplified version showing the structure
-            if trade.trade_type == TradeType.SWAP:
-                quote = await self._get_jupiter_quote(
-                    trade.symbol,
-                    trade.amount,
-                    trade.slippage
-                )
-                
-                if not quote:
-                    return TradeResult(
-                        trade_id="",
-                        platform=Platform.SOLANA,
-                        status=TradeStatus.FAILED,
-                        timestamp=datetime.utcnow(),
-                        error="Failed to get quote"
-                    )
-                
-                # Execute swap
-                tx_signature = await self._execute_jupiter_swap(quote)
-                
-                return TradeResult(
-                    trade_id=tx_signature,
-                    platform=Platform.SOLANA,
-                    status=TradeStatus.COMPLETED,
-                    transaction_hash=tx_signature,
-                    executed_amount=trade.amount,
-                    executed_price=quote.get("price"),
-                    fee=quote.get("fee", 0),
-                    timestamp=datetime.utcnow()
-                )
-            
-            return TradeResult(
-                trade_id="",
-                platform=Platform.SOLANA,
-                status=TradeStatus.FAILED,
-                timestamp=datetime.utcnow(),
-                error=f"Trade type {trade.trade_type} not supported"
-            )
-            
-        except Exception as e:
             return TradeResult(
-                trade_id="",
-                platform=Platform.SOLANA,
-                status=TradeStatus.FAILED,
-                timestamp=datetime.utcnow(),
-                error=str(e)
+                trade_id=tx_signature,
+                platform=_PLATFORM,
+                status=TradeStatus.COMPLETED,
+                transaction_hash=tx_signature,
+                executed_amount=trade.amount,
+                executed_price=quote.get("price"),
+                fee=quote.get("fee", 0)
             )
+        
+        return TradeResult(
+            trade_id="",
+            platform=_PLATFORM,
+            status=TradeStatus.FAILED,
+            error=f"Trade type {trade.trade_type} not supported"
+        )
     
     async def _get_jupiter_quote(
         self,
@@ -131,25 +135,32 @@ class SolanaAdapter(BasePlatform):
         return "mock_transaction_signature"
     
     async def get_balance(self, token: Optional[str] = None) -> dict[str, float]:
-        """Get SOL and SPL token balances."""
+        """Get SOL and SPL token balances, keyed by "SOL" or token mint."""
         if not self.wallet:
             return {}
         
-        try:
-            client = await self._get_client()
-            
-            # Get SOL balance
-            response = await client.get_balance(self.wallet.pubkey())
-            sol_balance = response.value / 1e9  # Convert lamports to SOL
-            
-            balances = {"SOL": sol_balance}
-            
-            # In production, fetch SPL token balances
-            # using getTokenAccountsByOwner
-            
-            return balances
-        except Exception:
-            return {}
+        client = await self._get_client()
+        
+        if token:
+            opts = TokenAccountOpts(mint=Pubkey.from_string(token))
+        else:
+            opts = TokenAccountOpts(program_id=TOKEN_PROGRAM_ID)
+        
+        # jsonParsed token accounts carry their amounts, so one call
+        # covers every mint alongside the SOL balance
+        sol_response, token_response = await asyncio.gather(
+            client.get_balance(self._pubkey),
+            client.get_token_accounts_by_owner_json_parsed(self._pubkey, opts)
+        )
+        
+        balances = {"SOL": sol_response.value / 1e9}  # Convert lamports to SOL
+        
+        for account in token_response.value:
+            info = account.account.data.parsed["info"]
+            amount = info["tokenAmount"].get("uiAmount") or 0.0
+            balances[info["mint"]] = balances.get(info["mint"], 0.0) + amount
+        
+        return balances
     
     async def get_price(self, symbol: str) -> float:
         """Get current price from Jupiter or other oracle."""
@@ -1,41 +1,156 @@
-from typing import Optional
-from ..models import TradeRequest, TradeResult, PlatformCredentials, Platform
+import asyncio
+from collections import defaultdict
+from typing import AsyncIterator, Optional
+import aiohttp
+import orjson
+import yarl
+from ..models import TradeRequest, TradeResult, TradeStatus, PlatformCredentials, Platform
 from ..platforms import get_platform_adapter, BasePlatform
 
 
 class TradeRouter:
     """Route trades to appropriate platforms."""
     
-    def __init__(self):
+    # Max concurrent in-flight calls per platform adapter
+    PLATFORM_CONCURRENCY = 20
+    
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.platforms: dict[Platform, BasePlatform] = {}
+        # Adapter and its concurrency limit, resolved with a single lookup
+        self._routes: dict[Platform, tuple[BasePlatform, asyncio.Semaphore]] = {}
+        # A caller-provided session is used as-is and left open by close_all
+        self._session = session
+        self._owns_session = session is None
+        self._warmups: set[asyncio.Task] = set()
+    
+    async def __aenter__(self) -> "TradeRouter":
+        """Use the router as an async context manager."""
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        """Close all platform connections on exit."""
+        await self.close_all()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get or create the HTTP session shared by all adapters."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=30,
+                    use_dns_cache=True,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                    enable_cleanup_closed=True
+                ),
+                timeout=BasePlatform.REQUEST_TIMEOUT,
+                json_serialize=lambda value: orjson.dumps(value).decode()
+            )
+            self._owns_session = True
+        return self._session
     
     def register_platform(self, credentials: PlatformCredentials) -> None:
         """Register a platform with credentials."""
-        adapter = get_platform_adapter(credentials)
+        adapter = get_platform_adapter(credentials, self._get_session())
         self.platforms[credentials.platform] = adapter
+        self._routes[credentials.platform] = (
+            adapter,
+            asyncio.Semaphore(self.PLATFORM_CONCURRENCY)
+        )
+        self._warm_dns(adapter)
+    
+    def _warm_dns(self, adapter: BasePlatform) -> None:
+        """Resolve an adapter's API host in the background so the first
+        request finds it in the connector's DNS cache."""
+        if not adapter.BASE_URL:
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Registered outside an event loop; the first request resolves it
+            return
+        
+        task = loop.create_task(self._resolve_host(yarl.URL(adapter.BASE_URL)))
+        self._warmups.add(task)
+        task.add_done_callback(self._warmups.discard)
+    
+    async def _resolve_host(self, url: yarl.URL) -> None:
+        """Resolve a host through the shared connector, filling its cache."""
+        connector = self._get_session().connector
+        if not isinstance(connector, aiohttp.TCPConnector):
+            return
+        
+        try:
+            await connector._resolve_host(url.host, url.port)
+        except Exception:
+            pass  # Best effort; a failure resurfaces on the first request
     
     def unregister_platform(self, platform: Platform) -> None:
         """Unregister a platform."""
         if platform in self.platforms:
             del self.platforms[platform]
+            del self._routes[platform]
     
     async def execute_trade(self, trade: TradeRequest) -> TradeResult:
         """Route and execute a trade."""
-        platform = self.platforms.get(trade.platform)
+        route = self._routes.get(trade.platform)
+        
+        if route is None:
+            return self._failed(trade, f"Platform {trade.platform.value} not registered")
+        
+        adapter, semaphore = route
+        try:
+            async with semaphore:
+                return await adapter.execute_trade(trade)
+        except Exception as e:
+            return self._failed(trade, str(e))
+    
+    async def execute_trades(self, trades: list[TradeRequest]) -> list[TradeResult]:
+        """Execute several trades, handing each platform its trades as one batch.
+        
+        Platforms run concurrently. Results are returned in input order.
+        """
+        groups: dict[Platform, list[int]] = defaultdict(list)
+        for index, trade in enumerate(trades):
+            groups[trade.platform].append(index)
         
-        if not platform:
-            from datetime import datetime
-            from ..models import TradeStatus
+        results: list[Optional[TradeResult]] = [None] * len(trades)
+        
+        async def run_group(platform: Platform, indices: list[int]) -> None:
+            batch = [trades[index] for index in indices]
+            route = self._routes.get(platform)
             
-            return TradeResult(
-                trade_id="",
-                platform=trade.platform,
-                status=TradeStatus.FAILED,
-                timestamp=datetime.utcnow(),
-                error=f"Platform {trade.platform.value} not registered"
-            )
+            if route is None:
+                error = f"Platform {platform.value} not registered"
+                batch_results = [error] * len(batch)
+            else:
+                adapter, semaphore = route
+                try:
+                    async with semaphore:
+                        batch_results = await adapter.execute_trades(batch)
+                except Exception as e:
+                    batch_results = [e] * len(batch)
+            
+            for index, trade, result in zip(indices, batch, batch_results):
+                if not isinstance(result, TradeResult):
+                    result = self._failed(trade, str(result))
+                results[index] = result
         
-        return await platform.execute_trade(trade)
+        await asyncio.gather(
+            *(run_group(platform, indices) for platform, indices in groups.items())
+        )
+        return results
+    
+    @staticmethod
+    def _failed(trade: TradeRequest, error: str) -> TradeResult:
+        """Build a failed result for a trade."""
+        return TradeResult(
+            trade_id="",
+            platform=trade.platform,
+            status=TradeStatus.FAILED,
+            error=error
+        )
     
     async def get_balance(
         self,
@@ -43,35 +158,91 @@ class TradeRouter:
         token: Optional[str] = None
     ) -> dict[str, float]:
         """Get balance from a platform."""
-        adapter = self.platforms.get(platform)
-        if not adapter:
+        route = self._routes.get(platform)
+        if route is None:
             return {}
         
-        return await adapter.get_balance(token)
+        adapter, semaphore = route
+        try:
+            async with semaphore:
+                return await adapter.get_balance(token)
+        except Exception:
+            return {}
     
     async def get_price(self, platform: Platform, symbol: str) -> float:
         """Get price from a platform."""
-        adapter = self.platforms.get(platform)
-        if not adapter:
+        route = self._routes.get(platform)
+        if route is None:
             return 0.0
         
-        return await adapter.get_price(symbol)
+        adapter, semaphore = route
+        try:
+            async with semaphore:
+                return await adapter.get_price(symbol)
+        except Exception:
+            return 0.0
     
     async def get_all_balances(self) -> dict[Platform, dict[str, float]]:
         """Get balances from all registered platforms."""
-        balances = {}
+        platforms = list(self.platforms)
+        results = await asyncio.gather(
+            *(self.get_balance(platform) for platform in platforms),
+            return_exceptions=True
+        )
         
-        for platform, adapter in self.platforms.items():
-            try:
-                balances[platform] = await adapter.get_balance()
-            except Exception:
-                balances[platform] = {}
+        return {
+            platform: {} if isinstance(result, Exception) else result
+            for platform, result in zip(platforms, results)
+        }
+    
+    async def stream_balances(self) -> AsyncIterator[tuple[Platform, dict[str, float]]]:
+        """Yield each registered platform's balances as soon as it responds."""
+        tasks = [
+            asyncio.create_task(self._platform_balance(platform))
+            for platform in list(self.platforms)
+        ]
         
-        return balances
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _platform_balance(self, platform: Platform) -> tuple[Platform, dict[str, float]]:
+        """Get a platform's balances tagged with the platform."""
+        return platform, await self.get_balance(platform)
+    
+    async def get_all_prices(
+        self,
+        symbols: dict[Platform, str]
+    ) -> dict[Platform, float]:
+        """Get prices for one symbol per platform concurrently."""
+        platforms = list(symbols)
+        results = await asyncio.gather(
+            *(self.get_price(platform, symbols[platform]) for platform in platforms),
+            return_exceptions=True
+        )
+        
+        return {
+            platform: 0.0 if isinstance(result, Exception) else result
+            for platform, result in zip(platforms, results)
+        }
     
     async def close_all(self) -> None:
         """Close all platform connections."""
-        for adapter in self.platforms.values():
-            if hasattr(adapter, 'close'):
-                await adapter.close()
+        for task in self._warmups:
+            task.cancel()
+        
+        await asyncio.gather(
+            *(
+                adapter.close()
+                for adapter in self.platforms.values()
+                if hasattr(adapter, 'close')
+            ),
+            return_exceptions=True
+        )
+        
+        if self._owns_session and self._session and not self._session.closed:
+            await self._session.close()
 
@@ -3,127 +3,174 @@ Multi-platform trading example.
 
 This script demonstrates how to:
 1. Register multiple platforms
-2. Get balances across all platforms
-3. Execute trades on different platforms
+2. Stream balances across all platforms
+3. Execute trades on different platforms in one batched call
+
+Pass --platforms (e.g. --platforms solana,kalshi) to run only some of them.
 """
 
+import argparse
 import asyncio
 import sys
 import os
+from contextlib import AsyncExitStack
+from pathlib import Path
+
+import aiohttp
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
+try:
+    import uvloop
+except ImportError:  # uvloop isn't available on Windows
+    uvloop = None
+
+_BACKEND = str(Path(__file__).resolve().parent.parent / "backend")
+if _BACKEND not in sys.path:
+    sys.path.insert(0, _BACKEND)
 
 from src.models import Platform, TradeType, TradeRequest, PlatformCredentials
 from src.routers import TradeRouter
 
 
-async def main():
-    router = TradeRouter()
-    
-    # Register Solana
-    print("Registering platforms...")
-    
-    if os.getenv("SOLANA_PRIVATE_KEY"):
-        solana_creds = PlatformCredentials(
-            platform=Platform.SOLANA,
-            rpc_url="https://api.devnet.solana.com",
-            private_key=os.getenv("SOLANA_PRIVATE_KEY")
-        )
-        router.register_platform(solana_creds)
-        print("✓ Solana registered")
-    
-    # Register Polymarket
-    if os.getenv("POLYMARKET_API_KEY"):
-        polymarket_creds = PlatformCredentials(
-            platform=Platform.POLYMARKET,
-            api_key=os.getenv("POLYMARKET_API_KEY"),
-            secret=os.getenv("POLYMARKET_SECRET"),
-            passphrase=os.getenv("POLYMARKET_PASSPHRASE")
-        )
-        router.register_platform(polymarket_creds)
-        print("✓ Polymarket registered")
-    
-    # Register Kalshi
-    if os.getenv("KALSHI_API_KEY"):
-        kalshi_creds = PlatformCredentials(
-            platform=Platform.KALSHI,
-            api_key=os.getenv("KALSHI_API_KEY"),
-            private_key=os.getenv("KALSHI_PRIVATE_KEY")
-        )
-        router.register_platform(kalshi_creds)
-        print("✓ Kalshi registered")
-    
-    # Get all balances
-    print("\n--- Platform Balances ---")
-    all_balances = await router.get_all_balances()
-    
-    for platform, balances in all_balances.items():
-        print(f"\n{platform.value.upper()}:")
+# Per platform: the env var holding its key, and a builder for the
+# remaining credential fields given the environment and that key
+PLATFORM_CONFIGS = (
+    (Platform.SOLANA, "SOLANA_PRIVATE_KEY", lambda env, key: {
+        "rpc_url": "https://api.devnet.solana.com",
+        "private_key": key
+    }),
+    (Platform.POLYMARKET, "POLYMARKET_API_KEY", lambda env, key: {
+        "api_key": key,
+        "secret": env.get("POLYMARKET_SECRET"),
+        "passphrase": env.get("POLYMARKET_PASSPHRASE")
+    }),
+    (Platform.KALSHI, "KALSHI_API_KEY", lambda env, key: {
+        "api_key": key,
+        "private_key": env.get("KALSHI_PRIVATE_KEY")
+    }),
+)
+
+# Example trades are static, so they are built and validated once at import
+EXAMPLE_TRADES = {
+    Platform.SOLANA: TradeRequest(
+        platform=Platform.SOLANA,
+        trade_type=TradeType.SWAP,
+        symbol="SOL/USDC",
+        amount=0.1,
+        slippage=0.01
+    ),
+    Platform.POLYMARKET: TradeRequest(
+        platform=Platform.POLYMARKET,
+        trade_type=TradeType.BUY,
+        symbol="MARKET_ID_HERE",
+        amount=10,
+        price=0.60
+    ),
+    Platform.KALSHI: TradeRequest(
+        platform=Platform.KALSHI,
+        trade_type=TradeType.BUY,
+        symbol="TICKER_HERE",
+        amount=5,
+        price=0.55
+    ),
+}
+
+
+def emit(lines: list[str]) -> None:
+    """Write a block of output lines with a single stdout write."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def print_balances(router: TradeRouter) -> None:
+    """Print each platform's balances as soon as it responds."""
+    async for platform, balances in router.stream_balances():
+        out = [f"\n{platform.value.upper()}:"]
         if balances:
-            for token, amount in balances.items():
-                print(f"  {token}: {amount:.6f}")
+            out.extend(f"  {token}: {amount:.6f}" for token, amount in balances.items())
         else:
-            print("  No balances or connection failed")
+            out.append("  No balances or connection failed")
+        emit(out)
+
+
+def parse_platforms(value: str) -> set[Platform]:
+    """Parse a comma-separated list of platform names."""
+    try:
+        return {Platform(name.strip().lower()) for name in value.split(",") if name.strip()}
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+async def main(requested: set[Platform]):
+    # One pooled keep-alive session is shared by every platform adapter
+    connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, keepalive_timeout=30)
     
-    # Example: Execute trade on Solana
-    if Platform.SOLANA in router.platforms:
-        print("\n--- Executing Solana Trade ---")
-        
-        solana_trade = TradeRequest(
-            platform=Platform.SOLANA,
-            trade_type=TradeType.SWAP,
-            symbol="SOL/USDC",
-            amount=0.1,
-            slippage=0.01
+    # Exiting the stack closes the router's adapters, then the session,
+    # even if a step below raises
+    async with AsyncExitStack() as stack:
+        session = await stack.enter_async_context(
+            aiohttp.ClientSession(connector=connector)
         )
+        router = await stack.enter_async_context(TradeRouter(session=session))
+        env = os.environ
         
-        result = await router.execute_trade(solana_trade)
-        print(f"Status: {result.status.value}")
+        # Register every requested platform whose key is set
+        out = ["Registering platforms..."]
         
-        if result.error:
-            print(f"Error: {result.error}")
-    
-    # Example: Execute trade on Polymarket
-    if Platform.POLYMARKET in router.platforms:
-        print("\n--- Executing Polymarket Trade ---")
+        for platform, key_var, build in PLATFORM_CONFIGS:
+            if platform not in requested:
+                continue
+            
+            key = env.get(key_var)
+            if key:
+                router.register_platform(
+                    PlatformCredentials(platform=platform, **build(env, key))
+                )
+                out.append(f"✓ {platform.value.capitalize()} registered")
         
-        polymarket_trade = TradeRequest(
-            platform=Platform.POLYMARKET,
-            trade_type=TradeType.BUY,
-            symbol="MARKET_ID_HERE",
-            amount=10,
-            price=0.60
-        )
+        emit(out)
         
-        result = await router.execute_trade(polymarket_trade)
-        print(f"Status: {result.status.value}")
+        # Start fetching balances, then pick trades while they are in flight
+        emit(["\n--- Platform Balances ---"])
+        balances_task = asyncio.create_task(print_balances(router), name="balances")
         
-        if result.error:
-            print(f"Error: {result.error}")
-    
-    # Example: Execute trade on Kalshi
-    if Platform.KALSHI in router.platforms:
-        print("\n--- Executing Kalshi Trade ---")
+        # Pick the example trade for each registered platform
+        trades = [
+            trade
+            for platform, trade in EXAMPLE_TRADES.items()
+            if platform in router.platforms
+        ]
         
-        kalshi_trade = TradeRequest(
-            platform=Platform.KALSHI,
-            trade_type=TradeType.BUY,
-            symbol="TICKER_HERE",
-            amount=5,
-            price=0.55
-        )
+        # Balances should reflect the state before any trade is sent
+        await balances_task
         
-        result = await router.execute_trade(kalshi_trade)
-        print(f"Status: {result.status.value}")
+        # One call submits every trade, batched per platform
+        results = await router.execute_trades(trades)
         
-        if result.error:
-            print(f"Error: {result.error}")
+        out = []
+        for trade, result in zip(trades, results):
+            out.append(f"\n--- {trade.platform.value.capitalize()} Trade ---")
+            out.append(f"Status: {result.status.value}")
+            
+            if result.error:
+                out.append(f"Error: {result.error}")
     
-    # Cleanup
-    await router.close_all()
-    print("\n✓ All connections closed")
+    out.append("\n✓ All connections closed")
+    emit(out)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--platforms",
+        type=parse_platforms,
+        default=set(Platform),
+        help="comma-separated platforms to use (default: all)"
+    )
+    args = parser.parse_args()
+    
+    # Run on uvloop's faster event loop where it's installed. Debug mode is
+    # forced off so a stray PYTHONASYNCIODEBUG doesn't slow every await.
+    if uvloop:
+        uvloop.run(main(args.platforms), debug=False)
+    else:
+        asyncio.run(main(args.platforms), debug=False)
 